@@ -23,31 +23,66 @@ class BarGram(object):
         self.__time_fraction = time_fraction
 
         self.__create_bar_gram()
+        self.__note_dict_list = None
 
     def extract_features(self, df):
-        pitch_tuple = tuple(df.pitch.values.tolist())
+        return self.extract_pitch_features(df.pitch.values)
+
+    def extract_pitch_features(self, pitch_arr):
+        pitch_tuple = tuple(pitch_arr.tolist())
         arr = np.zeros(self.__dim)
-        try:
-            arr[self.pitch_tuple_list.index(pitch_tuple)] = 1
-        except ValueError:
+        pitch_key = self.__pitch_key_dict.get(pitch_tuple)
+        if pitch_key is None:
             pitch_key = np.random.randint(low=0, high=len(self.pitch_tuple_list))
-            arr[pitch_key] = 1
-
-        arr = arr.astype(float)
+        arr[pitch_key] = 1
         return arr
 
+    def extract_note_dict_list(self, midi_df_list):
+        '''
+        Extract notes of each program in each MIDI file, sorted by start time.
+
+        Args:
+            midi_df_list:   `list` of MIDI data extracted by `MidiController`, which must be the data of this `BarGram`.
+
+        Returns:
+            `list` of `dict` from program to `tuple` of start times, the last end time and pitches.
+        '''
+        if len(midi_df_list) != len(self.__midi_df_list) or any(
+            midi_df.equals(_midi_df) is False for midi_df, _midi_df in zip(midi_df_list, self.__midi_df_list)
+        ):
+            raise ValueError("`midi_df_list` must be the MIDI data of this `BarGram`.")
+
+        # Only samplers refer to the notes, so they are indexed once on first use.
+        if self.__note_dict_list is None:
+            self.__create_note_dict_list()
+        return self.__note_dict_list
+
     def __extract_bar_gram(self, midi_df):
-        start = 0
-        end = self.__time_fraction
+        if midi_df.shape[0] == 0:
+            return []
+
+        # The bars are the intervals of [start, start + `time_fraction`) that end before the last note.
+        bar_n = max(int(np.ceil(midi_df.end.max() / self.__time_fraction)) - 1, 0)
+        bar_start_arr = np.arange(bar_n) * self.__time_fraction
+
+        start_arr = midi_df.start.values
+        pitch_arr = midi_df.pitch.values
+        bar_arr = np.searchsorted(bar_start_arr, start_arr, side="right") - 1
+        bar_arr[start_arr >= bar_n * self.__time_fraction] = -1
+
+        # Group pitches by bar, keeping the order of notes in each bar.
+        order_arr = np.argsort(bar_arr, kind="stable")
+        bar_arr = bar_arr[order_arr]
+        pitch_arr = pitch_arr[order_arr]
+        split_arr = np.searchsorted(bar_arr, np.arange(bar_n + 1))
+
         pitch_tuple_list = []
-        while end < midi_df.end.max():
-            df = midi_df[(start <= midi_df.start) & (midi_df.start <= end)]
-            df = df[(df.start < end)]
-            pitch_tuple = tuple(df.pitch.values.tolist())
-            if pitch_tuple not in pitch_tuple_list:
+        pitch_tuple_set = set()
+        for bar in range(bar_n):
+            pitch_tuple = tuple(pitch_arr[split_arr[bar]:split_arr[bar+1]].tolist())
+            if pitch_tuple not in pitch_tuple_set:
+                pitch_tuple_set.add(pitch_tuple)
                 pitch_tuple_list.append(pitch_tuple)
-            start += self.__time_fraction
-            end += self.__time_fraction
 
         return pitch_tuple_list
 
@@ -63,6 +98,22 @@ class BarGram(object):
         self.__dim = len(pitch_tuple_list)
         self.__pitch_tuple_list = pitch_tuple_list
 
+        # Keys of the first occurrences, same as `list.index`.
+        pitch_key_dict = {}
+        for pitch_key, pitch_tuple in enumerate(pitch_tuple_list):
+            pitch_key_dict.setdefault(pitch_tuple, pitch_key)
+        self.__pitch_key_dict = pitch_key_dict
+
+    def __create_note_dict_list(self):
+        note_dict_list = []
+        for midi_df in self.__midi_df_list:
+            note_dict = {}
+            for program_key, df in midi_df.groupby("program", sort=False):
+                df = df.sort_values(by=["start"], kind="mergesort")
+                note_dict[program_key] = (df.start.values, df.end.max(), df.pitch.values)
+            note_dict_list.append(note_dict)
+        self.__note_dict_list = note_dict_list
+
     def set_readonly(self, value):
         ''' setter '''
         raise TypeError()
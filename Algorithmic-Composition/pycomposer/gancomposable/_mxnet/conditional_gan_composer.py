@@ -2,10 +2,6 @@
 import numpy as np
 import pandas as pd
 import mxnet as mx
-import mxnet as mx
-import mxnet.ndarray as nd
-import numpy as np
-import pandas as pd
 from mxnet.gluon.nn import Conv2D
 from mxnet.gluon.nn import Conv2DTranspose
 from mxnet.gluon.nn import BatchNorm
@@ -23,17 +19,12 @@ from pycomposer.samplabledata.truesampler._mxnet.bargramtruesampler.conditonal_b
 from pycomposer.bar_gram import BarGram
 
 from accelbrainbase.computableloss._mxnet.l2_norm_loss import L2NormLoss
-from accelbrainbase.extractabledata._mxnet.image_extractor import ImageExtractor
-from accelbrainbase.iteratabledata._mxnet.unlabeled_image_iterator import UnlabeledImageIterator
-from accelbrainbase.noiseabledata._mxnet.gauss_noise import GaussNoise
 from accelbrainbase.observabledata._mxnet.convolutional_neural_networks import ConvolutionalNeuralNetworks
 from accelbrainbase.observabledata._mxnet.neural_networks import NeuralNetworks
-from accelbrainbase.observabledata._mxnet.convolutionalneuralnetworks.convolutional_auto_encoder import ConvolutionalAutoEncoder
 from accelbrainbase.observabledata._mxnet.adversarialmodel.discriminative_model import DiscriminativeModel
 from accelbrainbase.observabledata._mxnet.adversarialmodel.generative_model import GenerativeModel
 from accelbrainbase.computableloss._mxnet.generator_loss import GeneratorLoss
 from accelbrainbase.computableloss._mxnet.discriminator_loss import DiscriminatorLoss
-from accelbrainbase.samplabledata.true_sampler import TrueSampler
 from accelbrainbase.samplabledata.condition_sampler import ConditionSampler
 from accelbrainbase.controllablemodel._mxnet.gan_controller import GANController
 
@@ -139,6 +130,11 @@ class ConditionalGANComposer(GANComposable):
         self.__midi_controller = MidiController()
         self.__midi_df_list = [self.__midi_controller.extract(midi_path) for midi_path in midi_path_list]
 
+        # The velocity in MIDI files, which `compose` refers to by default.
+        velocity_arr = np.concatenate([midi_df.velocity.values for midi_df in self.__midi_df_list]).astype(float)
+        self.__velocity_mean = velocity_arr.mean()
+        self.__velocity_std = velocity_arr.std()
+
         bar_gram = BarGram(
             midi_df_list=self.__midi_df_list,
             time_fraction=time_fraction
@@ -146,6 +142,15 @@ class ConditionalGANComposer(GANComposable):
         self.__bar_gram = bar_gram
         dim = self.__bar_gram.dim
 
+        # Flatten `pitch_tuple_list` so that `compose` can look up pitches by `np.ndarray` indexing.
+        pitch_len_arr = np.array([len(pitch_tuple) for pitch_tuple in bar_gram.pitch_tuple_list], dtype=int)
+        self.__pitch_len_arr = pitch_len_arr
+        self.__pitch_offset_arr = np.cumsum(pitch_len_arr) - pitch_len_arr
+        self.__pitch_arr = np.array(
+            [pitch for pitch_tuple in bar_gram.pitch_tuple_list for pitch in pitch_tuple],
+            dtype=int
+        )
+
         c_true_sampler = ConditionalBarGramTrueSampler(
             bar_gram=bar_gram,
             midi_df_list=self.__midi_df_list,
@@ -162,6 +167,9 @@ class ConditionalGANComposer(GANComposable):
             time_fraction=time_fraction
         )
 
+        # Models built here, whose sample shapes are fixed by `batch_size`, `seq_len` and `dim`.
+        static_model_list = []
+
         if generative_model is None:
             condition_sampler = ConditionSampler()
             condition_sampler.true_sampler = true_sampler
@@ -254,6 +262,7 @@ class ConditionalGANComposer(GANComposable):
                 scale=1.0, 
                 ctx=ctx, 
             )
+            static_model_list.extend([c_model, g_model, generative_model])
         else:
             if isinstance(generative_model, GenerativeModel) is False:
                 raise TypeError("The type of `generative_model` must be `GenerativeModel`.")
@@ -326,6 +335,7 @@ class ConditionalGANComposer(GANComposable):
                 scale=1.0, 
                 ctx=ctx, 
             )
+            static_model_list.extend([d_model, discriminative_model])
         else:
             if isinstance(discriminative_model, DiscriminativeModel) is False:
                 raise TypeError("The type of `discriminative_model` must be `DiscriminativeModel`.")
@@ -347,7 +357,13 @@ class ConditionalGANComposer(GANComposable):
             initializer=initializer,
         )
 
+        # Static graphs let MXNet plan the memory and select cuDNN algorithms only once.
+        # Models passed by the caller keep their own `hybridize_flag`.
+        for model in static_model_list:
+            model.hybridize(static_alloc=True, static_shape=True)
+
         self.__true_sampler = true_sampler
+        self.__program_arr = np.asarray(true_sampler.program_list)
         self.__generative_model = generative_model
         self.__discriminative_model = discriminative_model
         self.__GAN = GAN
@@ -405,45 +421,52 @@ class ConditionalGANComposer(GANComposable):
                             `velocity_mean` and `velocity_std`.
                             If `None`, the SD of velocity in MIDI files set to this parameter.
         '''
-        generated_arr = self.__generative_model.draw().asnumpy()
+        generated_arr = self.__generative_model.draw()
         channel = generated_arr.shape[1] // 2
-        generated_arr = generated_arr[:, channel:]
+        # Take the argmax on the device so that only the keys of bar-grams are copied to the host.
+        pitch_key_arr = generated_arr.slice_axis(
+            axis=1, 
+            begin=channel, 
+            end=None
+        ).argmax(axis=3).asnumpy().astype(int)
 
-        # @TODO(chimera0(RUM)): Fix the redundant processings.
         if velocity_mean is None:
-            velocity_mean = np.array(
-                [self.__midi_df_list[i].velocity.mean() for i in range(len(self.__midi_df_list))]
-            ).mean()
+            velocity_mean = self.__velocity_mean
         if velocity_std is None:
-            velocity_std = np.array(
-                [self.__midi_df_list[i].velocity.std() for i in range(len(self.__midi_df_list))]
-            ).std()
-
-        generated_list = []
-        start = 0
-        end = self.__time_fraction
-        for batch in range(generated_arr.shape[0]):
-            for seq in range(generated_arr.shape[2]):
-                add_flag = False
-                for program_key in range(generated_arr.shape[1]):
-                    pitch_key = np.argmax(generated_arr[batch, program_key, seq])
-                    pitch_tuple = self.__bar_gram.pitch_tuple_list[pitch_key]
-                    for pitch in pitch_tuple:
-                        velocity = np.random.normal(
-                            loc=velocity_mean, 
-                            scale=velocity_std
-                        )
-                        velocity = int(velocity)
-                        program = self.__true_sampler.program_list[program_key]
-                        generated_list.append((program, start, end, pitch, velocity))
-                        add_flag = True
-
-                if add_flag is True:
-                    start += self.__time_fraction
-                    end += self.__time_fraction
+            velocity_std = self.__velocity_std
+
+        # The shape is: (batch, seq, program).
+        pitch_key_arr = pitch_key_arr.transpose((0, 2, 1))
+        program_n = pitch_key_arr.shape[2]
+        pitch_key_arr = pitch_key_arr.reshape(-1)
+
+        # The number of notes in each (batch, seq, program).
+        note_n_arr = self.__pitch_len_arr[pitch_key_arr]
+        # Bars without any note do not advance the time.
+        add_arr = note_n_arr.reshape(-1, program_n).sum(axis=1) > 0
+        bar_arr = np.cumsum(add_arr) - add_arr
+
+        key_arr = np.repeat(np.arange(note_n_arr.shape[0]), note_n_arr)
+        note_offset_arr = np.cumsum(note_n_arr) - note_n_arr
+        tuple_key_arr = np.arange(key_arr.shape[0]) - note_offset_arr[key_arr]
+        pitch_arr = self.__pitch_arr[self.__pitch_offset_arr[pitch_key_arr[key_arr]] + tuple_key_arr]
+
+        program_arr = self.__program_arr[key_arr % program_n]
+        bar_arr = bar_arr[key_arr // program_n]
+        velocity_arr = np.random.normal(
+            loc=velocity_mean, 
+            scale=velocity_std,
+            size=key_arr.shape[0]
+        ).astype(int)
 
         generated_midi_df = pd.DataFrame(
-            generated_list, 
+            {
+                "program": program_arr,
+                "start": bar_arr * self.__time_fraction,
+                "end": (bar_arr + 1) * self.__time_fraction,
+                "pitch": pitch_arr,
+                "velocity": velocity_arr
+            },
             columns=[
                 "program",
                 "start", 
@@ -453,18 +476,17 @@ class ConditionalGANComposer(GANComposable):
             ]
         )
 
-        pitch_arr = generated_midi_df.pitch.drop_duplicates()
-        df_list = []
-        for pitch in pitch_arr:
-            df = generated_midi_df[generated_midi_df.pitch == pitch]
-            df = df.sort_values(by=["start", "end"])
-            df["next_start"] = df.start.shift(-1)
-            df["next_end"] = df.end.shift(-1)
-            df.loc[df.end == df.next_start, "end"] = df.loc[df.end == df.next_start, "next_end"]
-            df = df.drop_duplicates(["end"])
-            df_list.append(df)
-
-        generated_midi_df = pd.concat(df_list)
+        # Merge each note into the next note of the same pitch when they are contiguous.
+        generated_midi_df = generated_midi_df.sort_values(by=["pitch", "start", "end"]).reset_index(drop=True)
+        pitch_arr = generated_midi_df.pitch.values
+        start_arr = generated_midi_df.start.values
+        end_arr = generated_midi_df.end.values
+        same_pitch_arr = np.append(pitch_arr[1:] == pitch_arr[:-1], False)
+        next_start_arr = np.append(start_arr[1:], np.nan)
+        next_end_arr = np.append(end_arr[1:], np.nan)
+        merge_arr = same_pitch_arr & (end_arr == next_start_arr)
+        generated_midi_df["end"] = np.where(merge_arr, next_end_arr, end_arr)
+        generated_midi_df = generated_midi_df.drop_duplicates(["pitch", "end"])
         generated_midi_df = generated_midi_df.sort_values(by=["start", "end"])
 
         self.__midi_controller.save(
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import numpy as np
 import pandas as pd
 import pretty_midi
 
@@ -20,12 +21,24 @@ class MidiController(object):
             pd.DataFrame(columns=["program", "start", "end", "pitch", "velocity", "duration"])
         '''
         midi_data = pretty_midi.PrettyMIDI(file_path)
-        note_tuple_list = []
+        note_arr_list = [np.empty((0, 5))]
         for instrument in midi_data.instruments:
             if (is_drum is False and instrument.is_drum is False) or (is_drum is True and instrument.is_drum is True):
-                for note in instrument.notes:
-                    note_tuple_list.append((instrument.program, note.start, note.end, note.pitch, note.velocity))
-        note_df = pd.DataFrame(note_tuple_list, columns=["program", "start", "end", "pitch", "velocity"])
+                note_arr = np.array(
+                    [(instrument.program, note.start, note.end, note.pitch, note.velocity) for note in instrument.notes]
+                )
+                note_arr_list.append(note_arr.reshape(-1, 5))
+        note_arr = np.concatenate(note_arr_list)
+        note_df = pd.DataFrame(
+            {
+                "program": note_arr[:, 0].astype(int),
+                "start": note_arr[:, 1],
+                "end": note_arr[:, 2],
+                "pitch": note_arr[:, 3].astype(int),
+                "velocity": note_arr[:, 4].astype(int),
+            },
+            columns=["program", "start", "end", "pitch", "velocity"]
+        )
         note_df = note_df.sort_values(by=["program", "start", "end"])
         note_df["duration"] = note_df.end - note_df.start
 
@@ -42,15 +55,19 @@ class MidiController(object):
         '''
 
         chord = pretty_midi.PrettyMIDI()
-        for program in note_df.program.drop_duplicates().values.tolist():
-            df = note_df[note_df.program == program]
-            midi_obj = pretty_midi.Instrument(program=program)
-            for i in range(df.shape[0]):
+        for program, df in note_df.groupby("program", sort=False):
+            midi_obj = pretty_midi.Instrument(program=int(program))
+            for velocity, pitch, start, end in zip(
+                df.velocity.values,
+                df.pitch.values,
+                df.start.values,
+                df.end.values
+            ):
                 note = pretty_midi.Note(
-                    velocity=int(df.iloc[i, :]["velocity"]),
-                    pitch=int(df.iloc[i, :]["pitch"]),
-                    start=float(df.iloc[i, :]["start"]), 
-                    end=float(df.iloc[i, :]["end"])
+                    velocity=int(velocity),
+                    pitch=int(pitch),
+                    start=float(start), 
+                    end=float(end)
                 )
                 # Add it to our cello instrument
                 midi_obj.notes.append(note)
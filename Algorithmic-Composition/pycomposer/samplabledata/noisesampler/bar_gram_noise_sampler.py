@@ -26,7 +26,7 @@ class BarGramNoiseSampler(NoiseSampler):
         Init.
 
         Args:
-            bar_gram:               is-a `BarGram`.
+            bar_gram:               is-a `BarGram` built from `midi_df_list`.
             midi_path_list:         `list` of paths to MIDI files.
             batch_size:             Batch size.
             seq_len:                The length of sequneces.
@@ -50,6 +50,8 @@ class BarGramNoiseSampler(NoiseSampler):
             )
         program_list = list(set(program_list))
 
+        self.__note_dict_list = self.__bar_gram.extract_note_dict_list(self.__midi_df_list)
+
         self.__batch_size = batch_size
         self.__seq_len = seq_len
         self.__channel = len(program_list)
@@ -64,32 +66,41 @@ class BarGramNoiseSampler(NoiseSampler):
         Returns:
             `np.ndarray` of samples.
         '''
-        sampled_arr = np.zeros((self.__batch_size, self.__channel, self.__seq_len, self.__dim))
+        sampled_arr = np.zeros((self.__batch_size, self.__channel, self.__seq_len, self.__dim), dtype=np.float32)
+        key_arr = np.random.randint(
+            low=0, 
+            high=len(self.__note_dict_list), 
+            size=(self.__batch_size, len(self.__program_list))
+        )
 
         for batch in range(self.__batch_size):
             for i in range(len(self.__program_list)):
                 program_key = self.__program_list[i]
-                key = np.random.randint(low=0, high=len(self.__midi_df_list))
-                midi_df = self.__midi_df_list[key]
-                midi_df = midi_df[midi_df.program == program_key]
-                if midi_df.shape[0] < self.__seq_len:
+                note_dict = self.__note_dict_list[key_arr[batch, i]]
+                if program_key not in note_dict:
+                    continue
+
+                start_arr, end, pitch_arr = note_dict[program_key]
+                if start_arr.shape[0] < self.__seq_len:
                     continue
 
                 row = np.random.uniform(
-                    low=midi_df.start.min(), 
-                    high=midi_df.end.max() - (self.__seq_len * self.__time_fraction)
+                    low=start_arr[0], 
+                    high=end - (self.__seq_len * self.__time_fraction)
                 )
+                seq_arr = np.arange(self.__seq_len)
+                first_arr = np.searchsorted(start_arr, row + (seq_arr * self.__time_fraction), side="left")
+                last_arr = np.searchsorted(start_arr, row + ((seq_arr + 1) * self.__time_fraction), side="right")
                 for seq in range(self.__seq_len):
-                    start = row + (seq * self.__time_fraction)
-                    end = row + ((seq+1) * self.__time_fraction)
-                    df = midi_df[(start <= midi_df.start) & (midi_df.start <= end)]
-                    sampled_arr[batch, i, seq] = self.__convert_into_feature(df)
+                    sampled_arr[batch, i, seq] = self.__convert_into_feature(
+                        pitch_arr[first_arr[seq]:last_arr[seq]]
+                    )
 
         return sampled_arr
 
-    def __convert_into_feature(self, df):
-        arr = self.__bar_gram.extract_features(df)
-        return arr.reshape(1, -1).astype(float)
+    def __convert_into_feature(self, pitch_arr):
+        arr = self.__bar_gram.extract_pitch_features(pitch_arr)
+        return arr.reshape(1, -1)
 
     def get_channel(self):
         ''' getter '''
@@ -91,7 +91,8 @@ class LayerableCNN(metaclass=ABCMeta):
             'constant'
         )
 
-        cdef np.ndarray[DOUBLE_t, ndim=6] result_arr = np.zeros(
+        # Every element is overwritten below, so it does not need to be zero-filled.
+        cdef np.ndarray[DOUBLE_t, ndim=6] result_arr = np.empty(
             (
                 img_sample_n,
                 img_channel,
@@ -102,6 +103,8 @@ class LayerableCNN(metaclass=ABCMeta):
             )
         )
 
+        cdef int height
+        cdef int width
         cdef int max_height = 0
         cdef int max_width = 0
         for height in range(kernel_height):
@@ -89,11 +89,11 @@ class BatchNorm(object):
         else:
             _observed_arr = observed_arr.reshape((batch_size, 1, -1))
 
-        cdef np.ndarray[DOUBLE_t, ndim=1] mu_arr
-        cdef np.ndarray[DOUBLE_t, ndim=1] var_arr
-        cdef np.ndarray[DOUBLE_t, ndim=2] std_arr = np.empty((seq_len, _observed_arr[0].shape[1]))
-        cdef np.ndarray[DOUBLE_t, ndim=3] mean_diff_arr = np.empty_like(_observed_arr)
-        cdef np.ndarray[DOUBLE_t, ndim=3] z_scored_arr = np.empty_like(_observed_arr)
+        cdef np.ndarray[DOUBLE_t, ndim=2] mu_arr
+        cdef np.ndarray[DOUBLE_t, ndim=2] var_arr
+        cdef np.ndarray[DOUBLE_t, ndim=2] std_arr
+        cdef np.ndarray[DOUBLE_t, ndim=3] mean_diff_arr
+        cdef np.ndarray[DOUBLE_t, ndim=3] z_scored_arr
         cdef np.ndarray[DOUBLE_t, ndim=3] test_mean_arr
         cdef np.ndarray[DOUBLE_t, ndim=3] test_var_arr
 
@@ -108,15 +108,18 @@ class BatchNorm(object):
             test_var_arr = self.__init_test_var_arr
 
         if self.test_mode is False:
-            for seq in range(seq_len):
-                mu_arr = _observed_arr[:, seq].mean(axis=0)
-                mean_diff_arr[:, seq] = _observed_arr[:, seq] - mu_arr
-                var_arr = np.power(mean_diff_arr[:, seq], 2).mean(axis=0)
-                std_arr[seq] = np.sqrt(var_arr + 1e-08)
-                z_scored_arr[:, seq] = mean_diff_arr[:, seq] / std_arr[seq]
-                test_mean_arr[:, seq] = self.__momentum * test_mean_arr[:, seq] + (1 - self.__momentum) * mu_arr
-                test_var_arr[:, seq] = self.__momentum * test_var_arr[:, seq] + (1 - self.__momentum) * var_arr
+            # Var[x] = E[x^2] - E[x]^2, reduced over the batch for all sequences at once.
+            mu_arr = _observed_arr.mean(axis=0)
+            var_arr = np.maximum(np.square(_observed_arr).mean(axis=0) - np.square(mu_arr), 0)
+            std_arr = np.sqrt(var_arr + 1e-08)
+            mean_diff_arr = _observed_arr - mu_arr
+            z_scored_arr = mean_diff_arr / std_arr
+            test_mean_arr *= self.__momentum
+            test_mean_arr += (1 - self.__momentum) * mu_arr
+            test_var_arr *= self.__momentum
+            test_var_arr += (1 - self.__momentum) * var_arr
         else:
+            std_arr = np.empty((seq_len, _observed_arr[0].shape[1]))
             mean_diff_arr = _observed_arr - self.__test_mean_arr
             z_scored_arr = mean_diff_arr / np.sqrt(self.__test_var_arr + 1e-08)
 
@@ -140,10 +140,23 @@ class Adam(OptParams):
         return params_list
 
     def __multiply_arr_scalar(self, np.ndarray arr, scalar):
-        return np.nanprod([np.ones_like(arr) * scalar, arr], axis=0)
+        # Equivalent to `np.nanprod([np.ones_like(arr) * scalar, arr], axis=0)` without stacking temporaries.
+        result_arr = arr * scalar
+        nan_arr = np.isnan(arr)
+        if nan_arr.any():
+            result_arr[nan_arr] = scalar
+        return result_arr
 
     def __multiply_arrs(self, *args):
-        return np.nanprod(args, axis=0)
+        # Equivalent to `np.nanprod(args, axis=0)` without stacking temporaries.
+        result_arr = None
+        for arr in args:
+            arr = np.where(np.isnan(arr), 1, arr)
+            if result_arr is None:
+                result_arr = arr
+            else:
+                result_arr = result_arr * arr
+        return result_arr
 
     def __multiply_scalars(self, *args):
         return np.nanprod(args, axis=0)